@@ -201,6 +201,7 @@ void CTcpServer::StartAccept()
 /// @ErrorHandling Throws a std::runtime_error if the connection handler has
 /// not been defined with CTcpServer::RegisterHandler.
 /// @pre CTcpServer::RegisterHandler must be called prior to this function.
+/// @post Disables Nagle's algorithm on the accepted client socket.
 /// @post Calls m_handler to handle the client connection.
 /// @param error The error code if the connection failed.
 ///
@@ -217,6 +218,16 @@ void CTcpServer::HandleAccept(const boost::system::error_code & error)
     {
         Logger.Info << hdr() << "Accepted new client connection." << std::endl;
 
+        // protocol packets are small request / response pairs; do not let
+        // the kernel hold them back waiting to coalesce with later writes
+        boost::system::error_code ec;
+        m_client->set_option(boost::asio::ip::tcp::no_delay(true), ec);
+        if( ec )
+        {
+            Logger.Warn << hdr() << "Failed to set TCP_NODELAY: "
+                    << ec.message() << std::endl;
+        }
+
         if( m_handler.empty() )
         {
             throw std::runtime_error(hdr() + "Null connection handler.");